@@ -7,9 +7,16 @@ import math
 import json
 import re
 import time
+import functools
+import importlib.util
+import tempfile
+import argparse
+import struct
+import concurrent.futures
+import threading
 
-# Try to import moviepy, scan Termux if not found
-MOVIEPY_AVAILABLE = False
+# MoviePy is imported on first use, None until then
+MOVIEPY_AVAILABLE = None
 MOVIEPY_ERROR = None
 
 def find_moviepy_in_termux():
@@ -37,40 +44,45 @@ def find_moviepy_in_termux():
             if os.path.isdir(moviepy_path):
                 return moviepy_path
     
-    termux_base = "/data/data/com.termux/files"
-    if os.path.exists(termux_base):
-        try:
-            for root, dirs, files in os.walk(termux_base):
-                if "moviepy" in dirs:
-                    moviepy_path = os.path.join(root, "moviepy")
-                    if os.path.exists(os.path.join(moviepy_path, "__init__.py")) or \
-                       os.path.exists(os.path.join(moviepy_path, "editor.py")):
-                        return moviepy_path
-                if root.count(os.sep) - termux_base.count(os.sep) > 10:
-                    dirs.clear()
-        except PermissionError:
-            pass
+    try:
+        spec = importlib.util.find_spec("moviepy")
+    except (ImportError, ValueError):
+        spec = None
+    
+    if spec is not None and spec.origin:
+        return os.path.dirname(spec.origin)
     
     return None
 
-try:
-    import moviepy
-    import moviepy.editor
-    MOVIEPY_AVAILABLE = True
-except ImportError as e:
-    MOVIEPY_ERROR = str(e)
-    moviepy_location = find_moviepy_in_termux()
-    if moviepy_location:
-        parent_dir = os.path.dirname(moviepy_location)
-        if parent_dir not in sys.path:
-            sys.path.insert(0, parent_dir)
-        try:
-            import moviepy
-            import moviepy.editor
-            MOVIEPY_AVAILABLE = True
-            MOVIEPY_ERROR = None
-        except ImportError as e2:
-            MOVIEPY_ERROR = f"Found at {moviepy_location} but import failed: {e2}"
+def ensure_moviepy():
+    """Import moviepy the first time it is needed, scanning Termux if not found"""
+    global MOVIEPY_AVAILABLE, MOVIEPY_ERROR, moviepy
+    
+    # Its import pulls in NumPy, Pillow and friends, so FFmpeg-only runs never pay for it
+    if MOVIEPY_AVAILABLE is not None:
+        return MOVIEPY_AVAILABLE
+    
+    MOVIEPY_AVAILABLE = False
+    try:
+        import moviepy
+        import moviepy.editor
+        MOVIEPY_AVAILABLE = True
+    except ImportError as e:
+        MOVIEPY_ERROR = str(e)
+        moviepy_location = find_moviepy_in_termux()
+        if moviepy_location:
+            parent_dir = os.path.dirname(moviepy_location)
+            if parent_dir not in sys.path:
+                sys.path.insert(0, parent_dir)
+            try:
+                import moviepy
+                import moviepy.editor
+                MOVIEPY_AVAILABLE = True
+                MOVIEPY_ERROR = None
+            except ImportError as e2:
+                MOVIEPY_ERROR = f"Found at {moviepy_location} but import failed: {e2}"
+    
+    return MOVIEPY_AVAILABLE
 
 # Fixed pitch ratio: 2^(1/12) = 1 semitone up
 FIXED_PITCH_RATIO = 1.059463094352953
@@ -85,13 +97,92 @@ DEFAULT_TEXT_SIZE = 111
 # Default watermark size
 DEFAULT_WATERMARK_SIZE = 60
 
-# Maximum retry attempts for speed correction
-MAX_SPEED_RETRIES = 10
+# Font handed straight to drawtext so ffmpeg skips the fontconfig lookup on every run
+FONT_CANDIDATES = (
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    '/data/data/com.termux/files/usr/share/fonts/TTF/DejaVuSans.ttf',
+    '/system/fonts/Roboto-Regular.ttf',
+    '/System/Library/Fonts/Helvetica.ttc',
+    'C:/Windows/Fonts/arial.ttf',
+)
+FONT_PATH = next((path for path in FONT_CANDIDATES if os.path.exists(path)), None)
+DRAWTEXT_FONT = f"fontfile='{FONT_PATH}':" if FONT_PATH else ""
+
+# Mean volumes (dB) measured by volumedetect, keyed by _file_key
+_VOLUME_CACHE = {}
+
+# Volume measurements started in the background while the user answers prompts, keyed by path
+_VOLUME_PREFETCH = {}
+# Worker pool and its cancel flag, created on first prefetch and dropped again when cancelled
+_PREFETCH_POOL = None
+_PREFETCH_CANCELLED = None
+# volumedetect processes still running, so an aborted run can kill them instead of waiting
+_VOLUME_PROCS = set()
+
+# Hardware H.264 encoders (desktop GPUs, then Android/Termux), tried before libx264.
+# Set SPEEDEXP_HWENC=0 to skip them.
+HW_H264_ENCODERS = ('h264_nvenc', 'h264_qsv', 'h264_videotoolbox', 'h264_amf', 'h264_mediacodec', 'h264_v4l2m2m')
+
+# Re-times looped (-stream_loop) audio to a continuous clock from zero, so the
+# seam between the two passes over the input doesn't click or drift
+LOOP_AUDIO_SYNC = "aresample=async=1:first_pts=0"
+
+# x264 preset names mapped onto each hardware encoder's own speed setting
+HW_PRESET_PARAMS = {
+    'h264_nvenc': {'ultrafast': ['-preset', 'p1'], 'superfast': ['-preset', 'p2'],
+                   'veryfast': ['-preset', 'p3'], 'fast': ['-preset', 'p4']},
+    'h264_qsv': {'ultrafast': ['-preset', 'veryfast'], 'superfast': ['-preset', 'veryfast'],
+                 'veryfast': ['-preset', 'faster'], 'fast': ['-preset', 'fast']},
+    'h264_amf': {'ultrafast': ['-quality', 'speed'], 'superfast': ['-quality', 'speed'],
+                 'veryfast': ['-quality', 'speed'], 'fast': ['-quality', 'balanced']},
+}
+
+# Minimum seconds between in-place progress bar redraws (20 Hz)
+PROGRESS_MIN_INTERVAL = 0.05
+_last_progress_draw = 0.0
+_last_progress_line = ""
+
+# .mp4 counts per editor folder, keyed by (path, folder mtime)
+_MP4_COUNT_CACHE = {}
+
+# Maximum subfolder depth searched for the latest editor export
+MAX_SCAN_DEPTH = 3
+
+# RAM-backed scratch space for intermediate files (tmpfs on most Linux systems)
+RAM_TEMP_DIR = "/dev/shm"
+
+def get_temp_dir(default_dir, needed_bytes=0):
+    """Get directory for intermediate files, preferring RAM-backed storage"""
+    try:
+        if os.path.isdir(RAM_TEMP_DIR) and os.access(RAM_TEMP_DIR, os.W_OK):
+            # Keep half of the ramdisk free so we never starve the system of memory
+            if shutil.disk_usage(RAM_TEMP_DIR).free > needed_bytes * 2:
+                return RAM_TEMP_DIR
+    except OSError:
+        pass
+    
+    return default_dir
 
 def get_file_extension(smooth_mode=False):
     """Get file extension based on mode"""
     return '.mov' if smooth_mode else '.mp4'
 
+@functools.lru_cache(maxsize=1)
+def get_supported_filters():
+    """Names of all filters this ffmpeg build has (empty set if it can't be asked)"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-filters'], capture_output=True, text=True)
+        return frozenset(re.findall(r'^ [TSC.]{2,3} (\w+) ', result.stdout, re.M))
+    except Exception:
+        return frozenset()
+
+def detect_audio_filters():
+    """Detect rubberband and loudnorm support (ffmpeg is only asked once)"""
+    # Exact names, so a filter description mentioning one doesn't count
+    filters = get_supported_filters()
+    return 'rubberband' in filters, 'loudnorm' in filters
+
 def check_dependencies():
     """Check if required dependencies are installed"""
     if not shutil.which('ffmpeg'):
@@ -103,16 +194,13 @@ def check_dependencies():
     print("✓ FFmpeg found")
     print("✓ FFprobe found")
     
-    if MOVIEPY_AVAILABLE:
-        print("✓ MoviePy available")
+    # Only locate moviepy here, it is imported if MoviePy mode is chosen
+    if find_moviepy_in_termux():
+        print("✓ MoviePy found")
     else:
         print(f"⚠ MoviePy NOT available")
-        if MOVIEPY_ERROR:
-            print(f"  Error: {MOVIEPY_ERROR}")
     
-    result = subprocess.run(['ffmpeg', '-filters'], capture_output=True, text=True)
-    has_rubberband = 'rubberband' in result.stdout
-    has_loudnorm = 'loudnorm' in result.stdout
+    has_rubberband, has_loudnorm = detect_audio_filters()
     
     if has_rubberband:
         print("✓ Rubberband filter available")
@@ -126,6 +214,7 @@ def check_dependencies():
     
     return has_rubberband, has_loudnorm
 
+@functools.lru_cache(maxsize=1)
 def get_ffmpeg_version():
     """Get ffmpeg version"""
     try:
@@ -135,6 +224,28 @@ def get_ffmpeg_version():
     except:
         return "Unknown"
 
+def hw_encoder_works(codec):
+    """Check a hardware encoder with a tiny test encode (being listed does not mean usable)"""
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-f', 'lavfi', '-i', 'testsrc=duration=0.2:size=320x240:rate=30',
+             '-c:v', codec, '-pix_fmt', 'nv12', '-f', 'null', '-'],
+            capture_output=True, text=True, timeout=15
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def get_supported_encoders():
+    """Names of all encoders this ffmpeg build has (empty set if it can't be asked)"""
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], capture_output=True, text=True)
+        return frozenset(re.findall(r'^ [VAS][F.][S.][X.][B.][D.] (\w\S*)', result.stdout, re.M))
+    except Exception:
+        return frozenset()
+
+@functools.lru_cache(maxsize=1)
 def get_available_codecs():
     """Get list of available video codecs"""
     try:
@@ -149,7 +260,11 @@ def get_available_codecs():
             'ffv1': 'ffv1' in codecs_output.lower(),
         }
         
-        print(f"  Available codecs: {[k for k, v in available.items() if v]}")
+        encoders = get_supported_encoders()
+        hw_enabled = os.environ.get('SPEEDEXP_HWENC', '1') != '0'
+        for hw_codec in HW_H264_ENCODERS:
+            available[hw_codec] = hw_enabled and hw_codec in encoders and hw_encoder_works(hw_codec)
+        
         return available
         
     except Exception as e:
@@ -176,7 +291,15 @@ def select_codec_configs(preset='fast', smooth_mode=False):
             'params': ['-crf', '10', '-preset', preset, '-pix_fmt', 'yuv420p']
         })
     else:
-        # Normal mode
+        # Normal mode: hardware encoders first, software configs stay as the fallback chain
+        for hw_codec in HW_H264_ENCODERS:
+            if available.get(hw_codec):
+                configs.append({
+                    'name': f'H.264 Hardware ({hw_codec})',
+                    'codec': hw_codec,
+                    'params': HW_PRESET_PARAMS.get(hw_codec, {}).get(preset, []) + ['-b:v', '6M', '-pix_fmt', 'nv12']
+                })
+        
         if available.get('libx264') or available.get('h264'):
             configs.append({
                 'name': 'H.264 Baseline',
@@ -209,8 +332,43 @@ def select_codec_configs(preset='fast', smooth_mode=False):
             'params': ['-pix_fmt', 'yuv420p']
         })
     
+    # Skip encoders this build doesn't have instead of waiting for each to fail
+    encoders = get_supported_encoders()
+    if encoders:
+        supported = [config for config in configs if config['codec'] in encoders]
+        if supported:
+            configs = supported
+    
     return configs
 
+# Only the ffprobe fields the script reads (see get_video_info); skips tags, dispositions etc.
+PROBE_FORMAT_ENTRIES = 'duration,size,bit_rate'
+PROBE_STREAM_ENTRIES = 'codec_type,codec_name,width,height,r_frame_rate,sample_rate'
+
+@functools.lru_cache(maxsize=256)
+def _ffprobe_cached(path, size, mtime_ns):
+    """Run ffprobe once per file version and return the parsed JSON"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error',
+         '-show_entries', f'format={PROBE_FORMAT_ENTRIES}:stream={PROBE_STREAM_ENTRIES}',
+         '-of', 'json', path],
+        capture_output=True, text=True, timeout=10
+    )
+    
+    if result.returncode != 0:
+        raise ValueError("Cannot read video file")
+    
+    return json.loads(result.stdout)
+
+def _file_key(file_path):
+    """Cache key for one version of a file: (absolute path, size, mtime)"""
+    st = os.stat(file_path)
+    return os.path.abspath(file_path), st.st_size, st.st_mtime_ns
+
+def _ffprobe_json(file_path):
+    """Get ffprobe JSON for a file, cached on (path, size, mtime)"""
+    return _ffprobe_cached(*_file_key(file_path))
+
 def validate_video_file(file_path):
     """Validate video file"""
     if not os.path.exists(file_path):
@@ -224,16 +382,9 @@ def validate_video_file(file_path):
         raise ValueError(f"File too small ({file_size} bytes)")
     
     try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 
-             'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', file_path],
-            capture_output=True, text=True, timeout=10
-        )
+        probe = _ffprobe_json(file_path)
         
-        if result.returncode != 0:
-            raise ValueError("Cannot read video file")
-        
-        duration = float(result.stdout.strip())
+        duration = float(probe.get('format', {}).get('duration', 0))
         if duration <= 0:
             raise ValueError("Video has no duration")
         
@@ -249,15 +400,7 @@ def validate_video_file(file_path):
 def get_video_info(file_path):
     """Get video information including frame rate"""
     try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_format', '-show_streams', '-of', 'json', file_path],
-            capture_output=True, text=True
-        )
-        
-        if result.returncode != 0:
-            raise ValueError("FFprobe failed")
-        
-        probe = json.loads(result.stdout)
+        probe = _ffprobe_json(file_path)
         
         video_stream = next((s for s in probe.get('streams', []) if s.get('codec_type') == 'video'), None)
         audio_stream = next((s for s in probe.get('streams', []) if s.get('codec_type') == 'audio'), None)
@@ -281,6 +424,7 @@ def get_video_info(file_path):
             'width': int(video_stream.get('width', 0)) if video_stream else 0,
             'height': int(video_stream.get('height', 0)) if video_stream else 0,
             'has_audio': audio_stream is not None,
+            'sample_rate': int(audio_stream.get('sample_rate', 44100)) if audio_stream else 44100,
             'fps': fps
         }
         return info
@@ -292,42 +436,110 @@ def get_video_info(file_path):
 def get_precise_duration(file_path):
     """Get precise video duration using ffprobe with high precision"""
     try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 
-             'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', file_path],
-            capture_output=True, text=True, timeout=10
-        )
-        
-        if result.returncode == 0:
-            return float(result.stdout.strip())
+        return float(_ffprobe_json(file_path)['format']['duration'])
     except:
         pass
     
     return get_video_info(file_path)['duration']
 
-def get_audio_volume(file_path):
-    """Get mean audio volume in dB"""
+def parse_mean_volume(ffmpeg_stderr):
+    """Parse mean_volume in dB from volumedetect output, None if not found"""
+    for line in ffmpeg_stderr.split('\n'):
+        if 'mean_volume' in line:
+            parts = line.split('mean_volume:')
+            if len(parts) > 1:
+                volume_str = parts[1].strip().split(' ')[0]
+                return float(volume_str)
+    
+    return None
+
+def get_audio_volume(file_path, quiet=False, cancelled=None):
+    """Get mean audio volume in dB, measured once per file version"""
+    # quiet: return None on failure instead of warning and guessing -20 dB,
+    # for the prefetch thread, which must not print over the prompts.
+    # cancelled: the prefetch's Event; if already set, ffmpeg is killed as soon as it starts
     try:
-        result = subprocess.run(
-            ['ffmpeg', '-i', file_path, '-af', 'volumedetect', '-vn', '-f', 'null', '-'],
-            capture_output=True, text=True
+        # Exports measure their own volume while being written
+        key = _file_key(file_path)
+        measured = _VOLUME_CACHE.get(key)
+        if measured is not None:
+            return measured
+        
+        proc = subprocess.Popen(
+            ['ffmpeg', '-nostats', '-i', file_path, '-af', 'volumedetect', '-vn', '-sn', '-dn', '-f', 'null', '-'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
         )
+        _VOLUME_PROCS.add(proc)
+        if cancelled is not None and cancelled.is_set():
+            proc.kill()
+        try:
+            _, stderr = proc.communicate()
+        finally:
+            _VOLUME_PROCS.discard(proc)
         
-        for line in result.stderr.split('\n'):
-            if 'mean_volume' in line:
-                parts = line.split('mean_volume:')
-                if len(parts) > 1:
-                    volume_str = parts[1].strip().split(' ')[0]
-                    return float(volume_str)
+        volume = parse_mean_volume(stderr)
+        if volume is not None:
+            _VOLUME_CACHE[key] = volume
+            return volume
         
-        return -20.0
+        return None if quiet else -20.0
         
     except Exception as e:
+        if quiet:
+            return None
         print(f"  Warning: Could not detect volume: {e}")
         return -20.0
 
+def probe_all(file_path, with_volume=False):
+    """Duration, size, fps and audio info in one dict, optionally with mean volume"""
+    info = get_video_info(file_path)
+    
+    if with_volume:
+        info['mean_volume'] = get_audio_volume(file_path) if info['has_audio'] else -20.0
+    
+    return info
+
+def prefetch_audio_volume(file_path):
+    """Start measuring a file's mean volume in the background (result lands in _VOLUME_CACHE)"""
+    global _PREFETCH_POOL, _PREFETCH_CANCELLED
+    
+    if file_path not in _VOLUME_PREFETCH:
+        if _PREFETCH_POOL is None:
+            _PREFETCH_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            _PREFETCH_CANCELLED = threading.Event()
+        _VOLUME_PREFETCH[file_path] = _PREFETCH_POOL.submit(
+            get_audio_volume, file_path, quiet=True, cancelled=_PREFETCH_CANCELLED
+        )
+
+def cancel_volume_prefetch():
+    """Drop background volume measurements that are no longer wanted and kill their ffmpeg"""
+    global _PREFETCH_POOL, _PREFETCH_CANCELLED
+    
+    # Without this, exiting waits for the worker thread to finish decoding the whole file
+    if _PREFETCH_POOL is not None:
+        _PREFETCH_CANCELLED.set()
+        for future in _VOLUME_PREFETCH.values():
+            future.cancel()
+        _PREFETCH_POOL.shutdown(wait=False, cancel_futures=True)
+        for proc in list(_VOLUME_PROCS):
+            proc.kill()
+        _PREFETCH_POOL = None
+        _PREFETCH_CANCELLED = None
+    _VOLUME_PREFETCH.clear()
+
+@functools.lru_cache(maxsize=256)
 def format_power_notation(number):
-    """Format large numbers in scientific notation"""
+    """Format large numbers in scientific notation, given as an int or a (base, exp) pair"""
+    if isinstance(number, tuple):
+        # Work in logs so 2^export_num is never built as a big int just to be printed
+        base, exp = number
+        log_value = exp * math.log10(base)
+        if log_value < 6:
+            return str(base ** exp)
+        exponent = math.floor(log_value)
+        mantissa = 10 ** (log_value - exponent)
+        return f"{mantissa:.2f} * 10^{exponent}"
+    
     if number < 1_000_000:
         return str(number)
     else:
@@ -364,14 +576,15 @@ def get_movies_directories():
     
     directories = []
     try:
-        for item in sorted(os.listdir(movies_path)):
-            item_path = os.path.join(movies_path, item)
-            if os.path.isdir(item_path):
-                try:
-                    os.listdir(item_path)
-                    directories.append((item, item_path))
-                except PermissionError:
-                    pass
+        with os.scandir(movies_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_dir():
+                    try:
+                        # Opening the folder is enough to check access, no need to read it all
+                        os.scandir(entry.path).close()
+                        directories.append((entry.name, entry.path))
+                    except PermissionError:
+                        pass
     except Exception as e:
         return movies_path, []
     
@@ -379,30 +592,34 @@ def get_movies_directories():
 
 def find_latest_mp4(directory):
     """Find the latest .mp4 file in directory"""
-    mp4_files = []
+    latest_file, latest_mtime = None, -1
+    pending = [(directory, 0)]
     
     try:
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.lower().endswith('.mp4'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        mtime = os.path.getmtime(file_path)
-                        size = os.path.getsize(file_path)
-                        if size > 1000:
-                            mp4_files.append((file_path, mtime, size))
-                    except:
-                        pass
+        while pending:
+            current_dir, depth = pending.pop()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < MAX_SCAN_DEPTH:
+                                    pending.append((entry.path, depth + 1))
+                            elif entry.name.lower().endswith('.mp4') and entry.is_file():
+                                st = entry.stat()
+                                if st.st_size > 1000 and st.st_mtime > latest_mtime:
+                                    latest_file, latest_mtime = entry.path, st.st_mtime
+                        except OSError:
+                            pass
+            except OSError:
+                # Unreadable subfolders are skipped, like os.walk does
+                pass
     except Exception as e:
         raise ValueError(f"Cannot access directory: {e}")
     
-    if not mp4_files:
+    if latest_file is None:
         raise FileNotFoundError("No .mp4 files found in directory")
     
-    mp4_files.sort(key=lambda x: x[1], reverse=True)
-    
-    latest_file = mp4_files[0][0]
-    
     try:
         validate_video_file(latest_file)
     except Exception as e:
@@ -410,6 +627,19 @@ def find_latest_mp4(directory):
     
     return latest_file
 
+def count_mp4_files(directory):
+    """Count .mp4 files directly in a directory, cached until the directory changes"""
+    key = (directory, os.stat(directory).st_mtime_ns)
+    
+    if key not in _MP4_COUNT_CACHE:
+        with os.scandir(directory) as entries:
+            _MP4_COUNT_CACHE[key] = sum(
+                1 for entry in entries
+                if entry.name.lower().endswith('.mp4') and entry.is_file(follow_symlinks=False)
+            )
+    
+    return _MP4_COUNT_CACHE[key]
+
 def select_video_from_movies():
     """Let user select video from movies directory"""
     movies_path, directories = get_movies_directories()
@@ -427,7 +657,7 @@ def select_video_from_movies():
     
     for i, (name, path) in enumerate(directories, 1):
         try:
-            mp4_count = sum(1 for f in os.listdir(path) if f.lower().endswith('.mp4'))
+            mp4_count = count_mp4_files(path)
             print(f"  [{i}] {name} ({mp4_count} mp4 files)")
         except:
             print(f"  [{i}] {name}")
@@ -437,7 +667,7 @@ def select_video_from_movies():
     
     while True:
         try:
-            selection = input(f"Select your video editor folder (1-{fNum}): ").strip()
+            selection = ask(f"Select your video editor folder (1-{fNum}): ")
             
             if not selection.isdigit():
                 raise ValueError("Please enter a number")
@@ -459,7 +689,7 @@ def select_video_from_movies():
             
         except FileNotFoundError as e:
             print(f"  ❌ Error: {e}")
-            retry = input("  Try another folder? (Y/N): ").strip().upper()
+            retry = ask("  Try another folder? (Y/N): ").upper()
             if retry != 'Y':
                 raise
         except ValueError as e:
@@ -467,68 +697,180 @@ def select_video_from_movies():
             continue
 
 def print_progress_bar(current, total, bar_length=50):
-    """Print progress bar with status text"""
+    """Redraw the single-line progress bar in place"""
+    global _last_progress_draw, _last_progress_line
+    
     if total == 0:
         return
     
+    # Finished exports always draw, in-between updates are throttled
+    now = time.monotonic()
+    if current != int(current) and now - _last_progress_draw < PROGRESS_MIN_INTERVAL:
+        return
+    _last_progress_draw = now
+    
     progress = current / total
     filled = int(bar_length * progress)
     bar = '█' * filled + '░' * (bar_length - filled)
     percent = progress * 100
     
-    sys.stdout.write('\033[2K\033[1A\033[2K\r')
-    print(f'[{bar}] {percent:.1f}%')
-    print(f'{current} out of {total} done.', end='', flush=True)
-
-def init_progress_bar():
-    """Initialize progress bar display"""
-    print()
-    print()
+    # Skip the write when nothing visible changed since the last frame
+    line = f'\r[{bar}] {percent:5.1f}% - {int(current)} out of {total} done.'
+    if line == _last_progress_line:
+        return
+    _last_progress_line = line
+    
+    sys.stdout.write(line)
+    sys.stdout.flush()
 
 def finish_progress_bar():
     """Finish progress bar and move to new line"""
-    print()
+    global _last_progress_line
+    _last_progress_line = ""
+    sys.stdout.write('\n')
+    sys.stdout.flush()
+
+# Option kinds, used to check values from a --config file the way argparse checks typed ones
+CONFIG_CHOICES = {
+    'pitch': ['none', 'normal', 'special'],
+    'preset': ['fast', 'veryfast', 'superfast', 'ultrafast'],
+}
+CONFIG_BOOL_OPTIONS = ('color', 'smooth', 'moviepy', 'compile')
+CONFIG_INT_OPTIONS = ('exports', 'start', 'text_size', 'watermark_size')
+
+def parse_args(argv=None):
+    """Parse command line options, anything left out is asked interactively"""
+    parser = argparse.ArgumentParser(
+        description="SpeedExp.py - a program for helping speedy collabs. "
+                    "Options not given here are asked for interactively."
+    )
+    parser.add_argument('--config', help="JSON file with any of the options below (command line wins)")
+    parser.add_argument('--video', help="video file location")
+    parser.add_argument('--exports', type=int, help="how much exports")
+    parser.add_argument('--start', type=int, help="starting number")
+    parser.add_argument('--pitch', choices=CONFIG_CHOICES['pitch'], help="pitch mode")
+    parser.add_argument('--text-size', type=int, help=f"text size (default {DEFAULT_TEXT_SIZE})")
+    parser.add_argument('--watermark-size', type=int, help=f"watermark size (default {DEFAULT_WATERMARK_SIZE})")
+    parser.add_argument('--color', action=argparse.BooleanOptionalAction, default=None, help="color mode (hue +25)")
+    parser.add_argument('--preset', choices=CONFIG_CHOICES['preset'], help="encoder preset")
+    parser.add_argument('--smooth', action=argparse.BooleanOptionalAction, default=None, help="smooth mode (lossless .mov)")
+    parser.add_argument('--moviepy', action=argparse.BooleanOptionalAction, default=None, help="use MoviePy mode")
+    parser.add_argument('--compile', action=argparse.BooleanOptionalAction, default=None, help="compile all exports into one video")
+    
+    # Config values become parser defaults, so the command line still wins and
+    # string values get the same type= conversion as typed options
+    pre_args, _ = parser.parse_known_args(argv)
+    
+    if pre_args.config:
+        with open(pre_args.config) as f:
+            config = json.load(f)
+        
+        if not isinstance(config, dict):
+            raise ValueError("Config file must contain a JSON object")
+        
+        defaults = {}
+        for key, value in config.items():
+            attr = key.replace('-', '_')
+            if attr == 'config' or attr not in vars(pre_args):
+                raise ValueError(f"Unknown option in config file: {key}")
+            
+            # argparse checks neither choices nor booleans on defaults, so do it here
+            if attr in CONFIG_BOOL_OPTIONS and not isinstance(value, bool):
+                raise ValueError(f"Config option {key} must be true or false, got {value!r}")
+            if attr in CONFIG_INT_OPTIONS and (isinstance(value, bool) or not isinstance(value, (int, str))):
+                raise ValueError(f"Config option {key} must be a whole number, got {value!r}")
+            if attr in CONFIG_CHOICES and value not in CONFIG_CHOICES[attr]:
+                raise ValueError(f"Config option {key} must be one of {', '.join(CONFIG_CHOICES[attr])}, got {value!r}")
+            if attr == 'video' and not isinstance(value, str):
+                raise ValueError(f"Config option {key} must be a file path, got {value!r}")
+            
+            defaults[attr] = value
+        
+        parser.set_defaults(**defaults)
+    
+    return parser.parse_args(argv)
 
-def get_user_inputs(use_editor_selection=False):
-    """Get and validate user inputs"""
+def ask(prompt):
+    """Prompt and read one stripped line straight from stdin"""
+    # Plain write + readline, no line-editing setup per prompt
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("No more input")
+    return line.strip()
+
+def answer_or_ask(value, prompt):
+    """Use a yes/no answer given on the command line, otherwise ask for it"""
+    if value is not None:
+        return 'Y' if value else 'N'
+    return ask(prompt).upper()
+
+def get_user_inputs(use_editor_selection=False, args=None):
+    """Get and validate user inputs, using any given on the command line"""
+    if args is None:
+        args = parse_args([])
+    
     try:
-        if use_editor_selection:
+        if args.video is not None:
+            video_path = args.video.strip().strip('"').strip("'")
+            validate_video_file(video_path)
+        elif use_editor_selection:
             video_path = select_video_from_movies()
         else:
-            video_path = input("Video File Location?: ").strip()
+            video_path = ask("Video File Location?: ")
             if not video_path:
                 raise ValueError("Video file location cannot be empty")
             
             video_path = video_path.strip('"').strip("'")
             validate_video_file(video_path)
         
-        exports_str = input("How much exports?: ").strip()
-        if not exports_str.isdigit():
-            raise ValueError("Number of exports must be a positive integer")
-        num_exports = int(exports_str)
-        if num_exports <= 0:
-            raise ValueError("Number of exports must be greater than 0")
-        if num_exports > 20:
-            confirm = input(f"Warning: {num_exports} exports may take long. Continue? (y/n): ")
-            if confirm.lower() != 'y':
-                raise ValueError("Export cancelled")
-        
-        start_str = input("Starting Number?: ").strip()
-        if not start_str.isdigit():
-            raise ValueError("Starting number must be a positive integer")
-        start_num = int(start_str)
+        # The source volume pass runs while the remaining questions are answered. It covers the
+        # whole file, like the exports' own volumedetect, so later adjustments compare like with like
+        if get_video_info(video_path).get('has_audio'):
+            prefetch_audio_volume(video_path)
+        
+        if args.exports is not None:
+            num_exports = args.exports
+            if num_exports <= 0:
+                raise ValueError("Number of exports must be greater than 0")
+        else:
+            exports_str = ask("How much exports?: ")
+            if not exports_str.isdigit():
+                raise ValueError("Number of exports must be a positive integer")
+            num_exports = int(exports_str)
+            if num_exports <= 0:
+                raise ValueError("Number of exports must be greater than 0")
+            if num_exports > 20:
+                confirm = ask(f"Warning: {num_exports} exports may take long. Continue? (y/n): ")
+                if confirm.lower() != 'y':
+                    raise ValueError("Export cancelled")
+        
+        if args.start is not None:
+            start_num = args.start
+        else:
+            start_str = ask("Starting Number?: ")
+            if not start_str.isdigit():
+                raise ValueError("Starting number must be a positive integer")
+            start_num = int(start_str)
         if start_num < 0:
             raise ValueError("Starting number must be non-negative")
         
         # Special pitches input (before normal pitch)
-        special_pitch_input = input("Use special pitches? (N/Y)?: ").strip().upper()
+        if args.pitch is not None:
+            special_pitch_input = 'Y' if args.pitch == 'special' else 'N'
+        else:
+            special_pitch_input = ask("Use special pitches? (N/Y)?: ").upper()
         if special_pitch_input == 'Y':
             enable_special_pitch = True
             enable_pitch = True
             print("  ✓ Special pitches enabled: +7st, -5st, +7st, -5st, ...")
         elif special_pitch_input == 'N':
             enable_special_pitch = False
-            pitch_input = input("Set Pitch Increase (N/Y)?: ").strip().upper()
+            if args.pitch is not None:
+                pitch_input = 'Y' if args.pitch == 'normal' else 'N'
+            else:
+                pitch_input = ask("Set Pitch Increase (N/Y)?: ").upper()
             if pitch_input not in ['N', 'Y']:
                 print("  Invalid input, defaulting to N")
                 enable_pitch = False
@@ -537,14 +879,17 @@ def get_user_inputs(use_editor_selection=False):
         else:
             print("  Invalid input, defaulting to N")
             enable_special_pitch = False
-            pitch_input = input("Set Pitch Increase (N/Y)?: ").strip().upper()
+            pitch_input = ask("Set Pitch Increase (N/Y)?: ").upper()
             if pitch_input not in ['N', 'Y']:
                 print("  Invalid input, defaulting to N")
                 enable_pitch = False
             else:
                 enable_pitch = pitch_input == 'Y'
         
-        text_size_input = input("Change text size to num?: ").strip()
+        if args.text_size is not None:
+            text_size_input = str(args.text_size)
+        else:
+            text_size_input = ask("Change text size to num?: ")
         if text_size_input == '' or not text_size_input.isdigit():
             if text_size_input != '':
                 print("  Error!: invalid size.")
@@ -555,34 +900,42 @@ def get_user_inputs(use_editor_selection=False):
                 print("  Error!: invalid size.")
                 text_size = DEFAULT_TEXT_SIZE
         
-        watermark_size_input = input("Resize watermark to?: ").strip()
+        if args.watermark_size is not None:
+            watermark_size_input = str(args.watermark_size)
+        else:
+            watermark_size_input = ask("Resize watermark to?: ")
         if watermark_size_input and watermark_size_input.isdigit():
             watermark_size = int(watermark_size_input)
             if watermark_size <= 0:
                 print("  Error!: invalid watermark size.")
                 watermark_size = DEFAULT_WATERMARK_SIZE
         else:
+            if args.watermark_size is not None:
+                print("  Error!: invalid watermark size.")
             watermark_size = DEFAULT_WATERMARK_SIZE
         
-        color_mode_input = input("Use Color Mode (N/Y)?: ").strip().upper()
+        color_mode_input = answer_or_ask(args.color, "Use Color Mode (N/Y)?: ")
         if color_mode_input not in ['N', 'Y']:
             print("  Invalid input, defaulting to N")
             enable_color_mode = False
         else:
             enable_color_mode = color_mode_input == 'Y'
         
-        fast_export_input = input("Use fast exports? (N/Y/Z/U)?: ").strip().upper()
-        if fast_export_input == 'Y':
-            preset = 'veryfast'
-        elif fast_export_input == 'Z':
-            preset = 'superfast'
-        elif fast_export_input == 'U':
-            preset = 'ultrafast'
-        elif fast_export_input == 'N':
-            preset = 'fast'
+        if args.preset is not None:
+            preset = args.preset
         else:
-            print("  Invalid input, defaulting to fast")
-            preset = 'fast'
+            fast_export_input = ask("Use fast exports? (N/Y/Z/U)?: ").upper()
+            if fast_export_input == 'Y':
+                preset = 'veryfast'
+            elif fast_export_input == 'Z':
+                preset = 'superfast'
+            elif fast_export_input == 'U':
+                preset = 'ultrafast'
+            elif fast_export_input == 'N':
+                preset = 'fast'
+            else:
+                print("  Invalid input, defaulting to fast")
+                preset = 'fast'
         
         return video_path, num_exports, start_num, enable_pitch, enable_special_pitch, text_size, enable_color_mode, preset, watermark_size
         
@@ -607,34 +960,82 @@ def create_exports_folder():
     
     return exports_dir
 
-def get_unique_filename(exports_dir, base_name, smooth_mode=False):
+def get_unique_filename(exports_dir, base_name, smooth_mode=False, taken_names=None):
     """Get unique filename with oID if exists"""
     ext = get_file_extension(smooth_mode)
-    output_path = os.path.join(exports_dir, f"{base_name}{ext}")
     
-    if not os.path.exists(output_path):
-        return output_path, base_name
+    # taken_names: set of file names already in exports_dir, checked instead of the
+    # filesystem; the chosen name is added so later calls in the same run skip it
+    if taken_names is None:
+        is_taken = lambda name: os.path.exists(os.path.join(exports_dir, name))
+    else:
+        is_taken = lambda name: name in taken_names
     
+    unique_name = base_name
     oID = 1
-    while True:
-        unique_name = f"{base_name}-{oID}"
-        unique_path = os.path.join(exports_dir, f"{unique_name}{ext}")
-        if not os.path.exists(unique_path):
-            return unique_path, unique_name
-        oID += 1
+    while is_taken(f"{unique_name}{ext}"):
         if oID > 999:
             raise RuntimeError("Too many duplicate files")
+        unique_name = f"{base_name}-{oID}"
+        oID += 1
+    
+    if taken_names is not None:
+        taken_names.add(f"{unique_name}{ext}")
+    
+    return os.path.join(exports_dir, f"{unique_name}{ext}"), unique_name
+
+# Characters drawtext needs escaped, mapped in one str.translate pass
+_FFMPEG_ESCAPE_TABLE = str.maketrans({
+    '\\': '\\\\',
+    ':': '\\:',
+    "'": "\\'",
+    '[': '\\[',
+    ']': '\\]',
+    ',': '\\,',
+    ';': '\\;',
+})
 
 def escape_text_for_ffmpeg(text):
     """Escape text for ffmpeg drawtext"""
-    text = text.replace('\\', '\\\\')
-    text = text.replace(':', '\\:')
-    text = text.replace("'", "\\'")
-    text = text.replace('[', '\\[')
-    text = text.replace(']', '\\]')
-    text = text.replace(',', '\\,')
-    text = text.replace(';', '\\;')
-    return text
+    return text.translate(_FFMPEG_ESCAPE_TABLE)
+
+def mp4_boxes_complete(file_path):
+    """Check an .mp4/.mov has ftyp first, moov, a non-empty mdat, and boxes covering the whole file"""
+    file_size = os.path.getsize(file_path)
+    box_types = []
+    has_media_data = False
+    
+    with open(file_path, 'rb') as f:
+        offset = 0
+        while offset < file_size:
+            f.seek(offset)
+            header = f.read(8)
+            if len(header) < 8:
+                return False
+            
+            box_size, box_type = struct.unpack('>I4s', header)
+            header_size = 8
+            if box_size == 1:
+                large = f.read(8)
+                if len(large) < 8:
+                    return False
+                box_size = struct.unpack('>Q', large)[0]
+                header_size = 16
+            elif box_size == 0:
+                box_size = file_size - offset
+            
+            if box_size < 8:
+                return False
+            
+            # Stands in for ffprobe's duration check: no encoded samples means no playable video
+            if box_type == b'mdat' and box_size > header_size:
+                has_media_data = True
+            
+            box_types.append(box_type)
+            offset += box_size
+    
+    return (offset == file_size and box_types[:1] == [b'ftyp'] and b'moov' in box_types
+            and has_media_data)
 
 def verify_output_file(file_path, min_size_kb=0):
     """Verify output file is valid"""
@@ -646,17 +1047,18 @@ def verify_output_file(file_path, min_size_kb=0):
         if size_kb < min_size_kb:
             return False, f"File too small ({size_kb:.1f} KB < {min_size_kb} KB)"
     
+    # A finished mp4/mov is recognisable from its box layout without starting ffprobe;
+    # anything else (or a layout that doesn't add up) gets the full ffprobe check
     try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 
-             'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', file_path],
-            capture_output=True, text=True, timeout=5
-        )
-        
-        if result.returncode != 0:
-            return False, "FFprobe failed"
+        if file_path.lower().endswith(('.mp4', '.mov')) and mp4_boxes_complete(file_path):
+            return True, "Valid"
+    except OSError:
+        pass
+    
+    try:
+        probe = _ffprobe_json(file_path)
         
-        duration = float(result.stdout.strip())
+        duration = float(probe.get('format', {}).get('duration', 0))
         if duration <= 0:
             return False, "Invalid duration"
         
@@ -673,41 +1075,172 @@ def find_existing_exports(exports_dir):
     if not os.path.exists(exports_dir):
         return []
     
-    for filename in os.listdir(exports_dir):
-        match = pattern.match(filename)
-        if match:
-            export_num = int(match.group(1))
-            file_path = os.path.join(exports_dir, filename)
-            if os.path.isfile(file_path) and os.path.getsize(file_path) > 1000:
-                export_files.append((export_num, filename, file_path))
+    with os.scandir(exports_dir) as entries:
+        for entry in entries:
+            match = pattern.match(entry.name)
+            if match and entry.is_file() and entry.stat().st_size > 1000:
+                export_num = int(match.group(1))
+                export_files.append((export_num, entry.name, entry.path))
     
     export_files.sort(key=lambda x: x[0])
     
     return export_files
 
+@functools.lru_cache(maxsize=None)
+def single_pass_filter_template(pitch_audio, has_audio, has_rubberband, enable_color_mode):
+    """Filter graph for one mode combination, with per-export values left as {placeholders}"""
+    video_filter = (
+        "setpts={pts}*PTS,fps={fps},"
+        f"drawtext={DRAWTEXT_FONT}text='{{text}}':"
+        "fontcolor=red:"
+        "bordercolor=blue:borderw=3:"
+        "fontsize={text_size}:"
+        "x=20:y=h-150"
+    )
+    
+    if enable_color_mode:
+        video_filter = f"{video_filter},hue=h=25"
+    
+    if not has_audio:
+        return video_filter
+    
+    if pitch_audio:
+        # Plain resample: pitch follows speed, same as MoviePy's speedx
+        audio_filter = "asetrate={rate},aresample={sample_rate}"
+    elif has_rubberband:
+        audio_filter = "rubberband=tempo={speed}"
+    else:
+        audio_filter = "{atempo}"
+    
+    return f'[0:v]{video_filter}[v];[0:a]{LOOP_AUDIO_SYNC},{audio_filter}[a]'
+
+def build_single_pass_command(input_path, output_path, text_string, speed_factor, pitch_audio, 
+                              has_audio, sample_rate, has_rubberband, text_size, enable_color_mode, 
+                              original_fps, codec, codec_params, smooth_mode=False):
+    """Build one ffmpeg command doing speedup, duplicate, text and color in a single pass"""
+    filter_graph = single_pass_filter_template(
+        pitch_audio, has_audio, has_rubberband, enable_color_mode
+    ).format(
+        pts=1.0 / speed_factor,
+        fps=original_fps,
+        text=escape_text_for_ffmpeg(text_string),
+        text_size=text_size,
+        speed=speed_factor,
+        atempo=chain_atempo(speed_factor),
+        rate=int(sample_rate * speed_factor),
+        sample_rate=sample_rate
+    )
+    
+    if smooth_mode:
+        audio_params = ['-c:a', 'pcm_s16le']
+    else:
+        audio_params = ['-c:a', 'aac', '-b:a', '128k']
+    
+    # -stream_loop 1 feeds the input twice, so the sped output is already duplicated
+    if has_audio:
+        cmd = [
+            'ffmpeg', '-stream_loop', '1', '-i', input_path,
+            '-filter_complex', filter_graph,
+            '-map', '[v]',
+            '-map', '[a]',
+            '-c:v', codec
+        ] + codec_params + audio_params + [
+            '-shortest', '-avoid_negative_ts', 'make_zero', '-y', output_path
+        ]
+    else:
+        cmd = [
+            'ffmpeg', '-stream_loop', '1', '-i', input_path,
+            '-vf', filter_graph,
+            '-c:v', codec
+        ] + codec_params + [
+            '-an',
+            '-y', output_path
+        ]
+    
+    return cmd
+
+def run_ffmpeg_with_progress(cmd, duration, progress_callback=None):
+    """Run an ffmpeg command, reporting progress (0-1) parsed from its -progress output"""
+    cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + cmd[1:]
+    
+    # stderr goes to a file so a chatty ffmpeg can never block on a full pipe
+    with tempfile.TemporaryFile(mode='w+') as stderr_file:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True)
+        
+        for line in process.stdout:
+            if progress_callback and duration > 0 and line.startswith('out_time_us='):
+                try:
+                    current = int(line.split('=', 1)[1]) / 1_000_000
+                except ValueError:
+                    # out_time_us=N/A until the first frame is written
+                    continue
+                progress_callback(min(current / duration, 1.0))
+        
+        process.wait()
+        stderr_file.seek(0)
+        return subprocess.CompletedProcess(cmd, process.returncode, '', stderr_file.read())
+
+def process_video_ffmpeg(input_path, output_path, export_num, iteration, enable_pitch, 
+                         enable_special_pitch, original_fps, has_rubberband, text_size, 
+                         enable_color_mode, preset, original_video_duration, smooth_mode=False, 
+                         progress_callback=None, input_info=None):
+    """Process video like MoviePy mode, but in a single ffmpeg pass"""
+    power_text = format_power_notation((2, export_num))
+    text_string = f"{export_num} - {power_text}"
+    
+    if input_info is None:
+        input_info = probe_all(input_path)
+    input_duration = input_info['duration']
+    if enable_pitch or enable_special_pitch:
+        speed_factor = input_duration / (original_video_duration / 2.0)
+        output_duration = original_video_duration
+    else:
+        speed_factor = 2.0
+        output_duration = input_duration
+    
+    last_error = None
+    
+    for codec_config in select_codec_configs(preset, smooth_mode):
+        cmd = build_single_pass_command(
+            input_path, output_path, text_string, speed_factor, enable_pitch or enable_special_pitch,
+            input_info.get('has_audio', True), input_info.get('sample_rate', 44100), has_rubberband,
+            text_size, enable_color_mode, original_fps, codec_config['codec'], codec_config['params'],
+            smooth_mode
+        )
+        
+        result = run_ffmpeg_with_progress(cmd, output_duration, progress_callback)
+        if result.returncode == 0:
+            valid, msg = verify_output_file(output_path)
+            if valid:
+                return True
+            last_error = msg
+        else:
+            last_error = result.stderr[-200:] if result.stderr else "Unknown"
+    
+    raise RuntimeError(f"All codecs failed: {last_error}")
+
 def process_video_moviepy(input_path, output_path, export_num, iteration, enable_pitch, 
                           enable_special_pitch, original_fps, has_rubberband, text_size, 
                           enable_color_mode, preset, original_video_duration, smooth_mode=False):
     """Process video using moviepy"""
-    if not MOVIEPY_AVAILABLE:
+    if not ensure_moviepy():
         raise RuntimeError(f"MoviePy not available: {MOVIEPY_ERROR}")
     
     video = None
     sped_video = None
-    final_video = None
     txt_clip = None
     result_video = None
     temp_files = []
     
     try:
-        export_pow = 2 ** export_num
-        power_text = format_power_notation(export_pow)
+        power_text = format_power_notation((2, export_num))
         text_string = f"{export_num} - {power_text}"
         
-        temp_dir = os.path.dirname(output_path)
+        temp_dir = get_temp_dir(os.path.dirname(output_path), os.path.getsize(input_path) * 3)
         
         video = moviepy.editor.VideoFileClip(input_path)
         has_audio = video.audio is not None
+        source_audio_filter = None
         
         if enable_pitch or enable_special_pitch:
             input_duration = video.duration
@@ -716,41 +1249,15 @@ def process_video_moviepy(input_path, output_path, export_num, iteration, enable
             sped_video = video.speedx(speed_factor)
         else:
             if has_audio:
-                video_no_audio = video.without_audio()
-                sped_video_only = video_no_audio.speedx(2)
-                
-                temp_audio_in = os.path.join(temp_dir, f"temp_audio_in_{export_num}_{os.getpid()}.aac")
-                temp_audio_out = os.path.join(temp_dir, f"temp_audio_out_{export_num}_{os.getpid()}.aac")
-                temp_files.extend([temp_audio_in, temp_audio_out])
-                
-                cmd_extract = [
-                    'ffmpeg', '-i', input_path,
-                    '-vn', '-acodec', 'aac', '-y', temp_audio_in
-                ]
-                subprocess.run(cmd_extract, capture_output=True)
-                
+                # Audio is sped straight from the source by ffmpeg in the final pass
+                sped_video = video.without_audio().speedx(2)
                 if has_rubberband:
-                    audio_filter = "rubberband=tempo=2.0"
-                else:
-                    audio_filter = "atempo=2.0"
-                
-                cmd_audio = [
-                    'ffmpeg', '-i', temp_audio_in,
-                    '-af', audio_filter,
-                    '-acodec', 'aac', '-y', temp_audio_out
-                ]
-                subprocess.run(cmd_audio, capture_output=True)
-                
-                if os.path.exists(temp_audio_out):
-                    processed_audio = moviepy.editor.AudioFileClip(temp_audio_out)
-                    sped_video = sped_video_only.set_audio(processed_audio)
+                    source_audio_filter = "rubberband=tempo=2.0"
                 else:
-                    sped_video = sped_video_only
+                    source_audio_filter = "atempo=2.0"
             else:
                 sped_video = video.speedx(2)
         
-        final_video = moviepy.editor.concatenate_videoclips([sped_video, sped_video])
-        
         try:
             txt_clip = moviepy.editor.TextClip(
                 text_string,
@@ -776,9 +1283,11 @@ def process_video_moviepy(input_path, output_path, export_num, iteration, enable
                     color='red'
                 )
         
-        txt_clip = txt_clip.set_position((20, final_video.h - 150)).set_duration(final_video.duration)
+        # Only one sped copy is rendered; both halves are identical (text included),
+        # so the final ffmpeg pass loops the render instead of MoviePy decoding it twice
+        txt_clip = txt_clip.set_position((20, sped_video.h - 150)).set_duration(sped_video.duration)
         
-        result_video = moviepy.editor.CompositeVideoClip([final_video, txt_clip])
+        result_video = moviepy.editor.CompositeVideoClip([sped_video, txt_clip])
         
         # Determine codec based on smooth mode - now using libx264 for both
         video_codec = 'libx264'
@@ -789,39 +1298,45 @@ def process_video_moviepy(input_path, output_path, export_num, iteration, enable
         
         temp_ext = get_file_extension(smooth_mode)
         
+        temp_output = os.path.join(temp_dir, f"temp_render_{export_num}_{os.getpid()}{temp_ext}")
+        temp_files.append(temp_output)
+        
+        result_video.write_videofile(
+            temp_output,
+            fps=original_fps,
+            codec=video_codec,
+            audio=source_audio_filter is None,
+            audio_codec=audio_codec,
+            preset=preset,
+            verbose=False,
+            logger=None
+        )
+        
+        cmd_final = ['ffmpeg', '-stream_loop', '1', '-i', temp_output]
+        
+        if source_audio_filter:
+            # Loop the source once so the sped audio matches the duplicated video
+            cmd_final.extend([
+                '-stream_loop', '1', '-i', input_path,
+                '-map', '0:v', '-map', '1:a',
+                '-af', source_audio_filter
+            ])
+        
         if enable_color_mode:
-            temp_output = os.path.join(temp_dir, f"temp_nocolor_{export_num}_{os.getpid()}{temp_ext}")
-            temp_files.append(temp_output)
-            
-            result_video.write_videofile(
-                temp_output,
-                fps=original_fps,
-                codec=video_codec,
-                audio_codec=audio_codec,
-                preset=preset,
-                verbose=False,
-                logger=None
-            )
-            
-            cmd_hue = [
-                'ffmpeg', '-i', temp_output,
-                '-vf', 'hue=h=25',
-                '-c:v', video_codec,
-                '-preset', preset,
-                '-c:a', 'copy',
-                '-y', output_path
-            ]
-            subprocess.run(cmd_hue, capture_output=True)
+            cmd_final.extend(['-vf', 'hue=h=25', '-c:v', video_codec, '-preset', preset])
         else:
-            result_video.write_videofile(
-                output_path,
-                fps=original_fps,
-                codec=video_codec,
-                audio_codec=audio_codec,
-                preset=preset,
-                verbose=False,
-                logger=None
-            )
+            cmd_final.extend(['-c:v', 'copy'])
+        
+        if source_audio_filter:
+            cmd_final.extend(['-c:a', audio_codec, '-shortest'])
+        else:
+            cmd_final.extend(['-c:a', 'copy'])
+        
+        cmd_final.extend(['-y', output_path])
+        result = subprocess.run(cmd_final, capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Final ffmpeg pass failed: {result.stderr[-300:]}")
         
         return True
         
@@ -829,7 +1344,7 @@ def process_video_moviepy(input_path, output_path, export_num, iteration, enable
         raise RuntimeError(f"MoviePy error: {e}")
         
     finally:
-        for clip in [video, sped_video, final_video, txt_clip, result_video]:
+        for clip in [video, sped_video, txt_clip, result_video]:
             if clip is not None:
                 try:
                     clip.close()
@@ -843,10 +1358,47 @@ def process_video_moviepy(input_path, output_path, export_num, iteration, enable
                 except:
                     pass
 
+def chain_atempo(tempo):
+    """Split a tempo into a chain of atempo filters each within atempo's 0.5-2.0 range"""
+    factors = []
+    
+    while tempo > 2.0:
+        factors.append(2.0)
+        tempo /= 2.0
+    
+    while tempo < 0.5:
+        factors.append(0.5)
+        tempo /= 0.5
+    
+    factors.append(tempo)
+    return ",".join(f"atempo={factor}" for factor in factors)
+
+def build_speedup_audio_filter(tempo, enable_pitch, enable_special_pitch, pitch_ratio, 
+                               has_rubberband, volume_adjustment, sample_rate=44100):
+    """Build the audio filter chain for one speedup, ending in volumedetect"""
+    if (enable_pitch or enable_special_pitch) and has_rubberband:
+        speed_filter = f"rubberband=tempo={tempo}:pitch={pitch_ratio}:pitchq=speed"
+    elif enable_pitch or enable_special_pitch:
+        # asetrate speeds the audio up by pitch_ratio as well, so atempo makes up only the rest
+        pitched_rate = int(sample_rate * pitch_ratio)
+        speed_filter = f"{chain_atempo(tempo / pitch_ratio)},asetrate={pitched_rate},aresample=44100"
+    elif has_rubberband:
+        speed_filter = f"rubberband=tempo={tempo}:pitchq=speed"
+    else:
+        speed_filter = chain_atempo(tempo)
+    
+    # volumedetect measures the written audio so the next export can skip its own volume pass
+    return f"{speed_filter},volume={volume_adjustment}dB,volumedetect"
+
 def build_speedup_command(input_path, output_path, tempo, video_pts, enable_pitch, 
                           enable_special_pitch, pitch_ratio, has_rubberband, has_audio, 
-                          volume_adjustment, original_fps, preset, smooth_mode=False):
-    """Build ffmpeg command for speedup with given tempo and video_pts"""
+                          volume_adjustment, original_fps, preset, smooth_mode=False,
+                          video_filter=None, codec_config=None, video_bitrate=None, target_duration=None,
+                          sample_rate=44100):
+    """Build ffmpeg command for speedup, duplicate, text and final encode with given tempo and video_pts"""
+    
+    # Every variant reads the input twice (-stream_loop 1), so the output is
+    # the sped clip already duplicated and no separate concat pass is needed
     
     # Determine codecs based on smooth mode - now using libx264 for both
     video_codec = 'libx264'
@@ -857,120 +1409,123 @@ def build_speedup_command(input_path, output_path, tempo, video_pts, enable_pitc
         video_params = ['-preset', preset, '-crf', '23', '-pix_fmt', 'yuv420p']
         audio_codec = 'aac'
     
-    if (enable_pitch or enable_special_pitch) and has_rubberband and has_audio:
-        audio_filter = f"rubberband=tempo={tempo}:pitch={pitch_ratio}:pitchq=speed,volume={volume_adjustment}dB"
-        
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-filter_complex',
-            f'[0:v]setpts={video_pts}*PTS[v];[0:a]{audio_filter}[a]',
-            '-map', '[v]',
-            '-map', '[a]',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-c:a', audio_codec,
-        ]
-        if not smooth_mode:
-            cmd.extend(['-b:a', '128k', '-ar', '44100'])
-        cmd.extend(['-shortest', '-y', output_path])
-        
-    elif (enable_pitch or enable_special_pitch) and not has_rubberband and has_audio:
-        pitched_rate = int(44100 * pitch_ratio)
-        audio_filter = f"atempo={tempo},asetrate={pitched_rate},aresample=44100,volume={volume_adjustment}dB"
-        
-        cmd = [
-            'ffmpeg', '-i', input_path,
+    if codec_config:
+        video_codec = codec_config['codec']
+        video_params = list(codec_config['params'])
+        if video_bitrate and not smooth_mode:
+            video_params += [
+                '-b:v', f'{video_bitrate}k',
+                '-maxrate', f'{int(video_bitrate * 1.5)}k',
+                '-bufsize', f'{int(video_bitrate * 2)}k'
+            ]
+    
+    # fps= drops the surplus frames right after setpts, so drawtext/hue only run on frames that
+    # are kept (output -r used to discard them after filtering, half the frames at 2x speed)
+    video_chain = f'setpts={video_pts}*PTS,fps={original_fps}'
+    if video_filter:
+        video_chain = f'{video_chain},{video_filter}'
+    
+    if smooth_mode:
+        output_params = ['-y', output_path]
+    else:
+        # No +faststart: exports are read back locally by the next export and by compile,
+        # so the extra rewrite pass to move moov forward only costs I/O. The compilation keeps it.
+        output_params = ['-max_muxing_queue_size', '1024', '-y', output_path]
+    
+    # Trim to the exact target instead of re-encoding until the duration lands
+    if target_duration:
+        output_params = ['-t', f'{target_duration:.6f}'] + output_params
+    
+    cmd = ['ffmpeg', '-hide_banner', '-nostats', '-stream_loop', '1', '-i', input_path]
+    
+    if has_audio:
+        audio_filter = build_speedup_audio_filter(
+            tempo, enable_pitch, enable_special_pitch, pitch_ratio, has_rubberband,
+            volume_adjustment, sample_rate
+        )
+        cmd += [
             '-filter_complex',
-            f'[0:v]setpts={video_pts}*PTS[v];[0:a]{audio_filter}[a]',
+            f'[0:v]{video_chain}[v];[0:a]{LOOP_AUDIO_SYNC},{audio_filter}[a]',
             '-map', '[v]',
-            '-map', '[a]',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-c:a', audio_codec,
+            '-map', '[a]'
         ]
+    else:
+        cmd += ['-vf', video_chain]
+    
+    cmd += ['-c:v', video_codec] + video_params
+    
+    if has_audio:
+        cmd += ['-c:a', audio_codec]
         if not smooth_mode:
-            cmd.extend(['-b:a', '128k', '-ar', '44100'])
-        cmd.extend(['-shortest', '-y', output_path])
+            cmd += ['-b:a', '128k', '-ar', '44100']
+        cmd += ['-shortest', '-avoid_negative_ts', 'make_zero']
+    else:
+        cmd += ['-an']
+    
+    return cmd + output_params
+
+def encode_with_fallback(codec_configs, output_path, build_cmd, silent=False):
+    """Run build_cmd(codec_config) for each codec until one writes a valid file"""
+    last_error = None
+    
+    for codec_config in codec_configs:
+        codec_name = codec_config['name']
         
-    elif (enable_pitch or enable_special_pitch) and not has_audio:
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-vf', f'setpts={video_pts}*PTS',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-an',
-            '-y', output_path
-        ]
-    elif has_rubberband and has_audio:
-        audio_filter = f"rubberband=tempo={tempo}:pitchq=speed,volume={volume_adjustment}dB"
+        if not silent:
+            print(f"    Trying {codec_name}...")
         
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-filter_complex',
-            f'[0:v]setpts={video_pts}*PTS[v];[0:a]{audio_filter}[a]',
-            '-map', '[v]',
-            '-map', '[a]',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-c:a', audio_codec,
-        ]
-        if not smooth_mode:
-            cmd.extend(['-b:a', '128k', '-ar', '44100'])
-        cmd.extend(['-shortest', '-y', output_path])
+        if os.path.exists(output_path):
+            try:
+                os.remove(output_path)
+            except:
+                pass
         
-    elif has_audio:
-        audio_filter = f"atempo={tempo},volume={volume_adjustment}dB"
+        # Only stderr is kept, and -nostats keeps it to warnings and the volumedetect summary
+        result = subprocess.run(build_cmd(codec_config), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-filter_complex',
-            f'[0:v]setpts={video_pts}*PTS[v];[0:a]{audio_filter}[a]',
-            '-map', '[v]',
-            '-map', '[a]',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-c:a', audio_codec,
-        ]
-        if not smooth_mode:
-            cmd.extend(['-b:a', '128k', '-ar', '44100'])
-        cmd.extend(['-shortest', '-y', output_path])
+        if result.returncode == 0:
+            valid, msg = verify_output_file(output_path)
+            if valid:
+                return codec_config, result
+            last_error = msg
+        else:
+            last_error = result.stderr[-200:] if result.stderr else "Unknown"
         
-    else:
-        cmd = [
-            'ffmpeg', '-i', input_path,
-            '-vf', f'setpts={video_pts}*PTS',
-            '-c:v', video_codec
-        ] + video_params + [
-            '-r', str(original_fps),
-            '-an',
-            '-y', output_path
-        ]
+        if not silent:
+            print(f"    ✗ {codec_name}: {last_error}")
     
-    return cmd
+    raise RuntimeError(f"All codecs failed: {last_error}")
 
 def process_video_cumulative(input_path, output_path, export_num, iteration, reference_size_mb, 
                              enable_pitch, enable_special_pitch, has_rubberband, has_loudnorm, 
                              target_volume_db, original_fps, original_video_duration, use_moviepy=False, 
                              silent=False, text_size=DEFAULT_TEXT_SIZE, enable_color_mode=False, 
-                             preset='fast', smooth_mode=False):
+                             preset='fast', smooth_mode=False, progress_callback=None, input_info=None):
     """Process video cumulatively - pitch mode uses duration correction, non-pitch uses standard 2x"""
     
     if use_moviepy:
-        return process_video_moviepy(input_path, output_path, export_num, iteration, 
-                                     enable_pitch, enable_special_pitch, original_fps, 
-                                     has_rubberband, text_size, enable_color_mode, preset, 
-                                     original_video_duration, smooth_mode)
-    
-    temp_files = []
+        try:
+            return process_video_ffmpeg(input_path, output_path, export_num, iteration, 
+                                        enable_pitch, enable_special_pitch, original_fps, 
+                                        has_rubberband, text_size, enable_color_mode, preset, 
+                                        original_video_duration, smooth_mode, progress_callback,
+                                        input_info)
+        except Exception as e:
+            # Only fall back to the MoviePy frame pipeline when ffmpeg could not do it
+            ffmpeg_error = e
+        
+        # Starts on its own line, the progress bar is usually mid-draw here
+        print(f"\n  ffmpeg single pass failed ({ffmpeg_error}), falling back to MoviePy")
+        try:
+            return process_video_moviepy(input_path, output_path, export_num, iteration, 
+                                         enable_pitch, enable_special_pitch, original_fps, 
+                                         has_rubberband, text_size, enable_color_mode, preset, 
+                                         original_video_duration, smooth_mode)
+        except Exception as e:
+            raise RuntimeError(f"{e} (after ffmpeg single pass failed: {ffmpeg_error})") from ffmpeg_error
     
     try:
-        export_pow = 2 ** export_num
-        power_text = format_power_notation(export_pow)
+        power_text = format_power_notation((2, export_num))
         
         if not silent:
             print(f"  Export power (2^{export_num}): {power_text}")
@@ -978,23 +1533,17 @@ def process_video_cumulative(input_path, output_path, export_num, iteration, ref
         text_string = f"{export_num} - {power_text}"
         text_escaped = escape_text_for_ffmpeg(text_string)
         
-        input_info = get_video_info(input_path)
-        input_duration = get_precise_duration(input_path)
+        # main() hands over what it already knows about the input (the previous export)
+        if input_info is None or 'mean_volume' not in input_info:
+            input_info = probe_all(input_path, with_volume=True)
+        input_duration = input_info['duration']
         input_size_mb = input_info['size'] / (1024 * 1024)
         has_audio = input_info['has_audio']
         input_fps = input_info.get('fps', original_fps)
         
-        current_volume = get_audio_volume(input_path) if has_audio else -20.0
+        current_volume = input_info['mean_volume']
         volume_adjustment = target_volume_db - current_volume
         
-        temp_dir = os.path.dirname(output_path)
-        temp_ext = get_file_extension(smooth_mode)
-        temp_sped = os.path.join(temp_dir, f"temp_sped_{export_num}_{os.getpid()}{temp_ext}")
-        temp_list = os.path.join(temp_dir, f"temp_list_{export_num}_{os.getpid()}.txt")
-        temp_concat = os.path.join(temp_dir, f"temp_concat_{export_num}_{os.getpid()}{temp_ext}")
-        
-        temp_files = [temp_sped, temp_list, temp_concat]
-        
         if enable_special_pitch:
             pitch_ratio, pitch_semitones = get_special_pitch_for_iteration(iteration)
             pitch_mode_name = f"SPECIAL PITCH ({pitch_semitones} semitones)"
@@ -1007,6 +1556,34 @@ def process_video_cumulative(input_path, output_path, export_num, iteration, ref
             pitch_semitones = "0"
             pitch_mode_name = "NON-PITCH"
         
+        # Speedup, duplicate, text and final encode all happen in one ffmpeg pass,
+        # so the bitrate is planned from the duration the output should have
+        if enable_pitch or enable_special_pitch:
+            planned_duration = original_video_duration
+        else:
+            planned_duration = input_duration
+        
+        target_size_mb = reference_size_mb * 1.15
+        target_bitrate_total = (target_size_mb * 8 * 1024) / planned_duration
+        audio_bitrate = 128
+        target_video_bitrate = max(500, int(target_bitrate_total - audio_bitrate))
+        
+        drawtext_filter = (
+            f"drawtext={DRAWTEXT_FONT}text='{text_escaped}':"
+            f"fontcolor=red:"
+            f"bordercolor=blue:borderw=3:"
+            f"fontsize={text_size}:"
+            f"box=1:boxcolor=black@0.12:boxborderw=8:"
+            f"x=20:y=h-th-20"
+        )
+        
+        if enable_color_mode:
+            video_filter = f"{drawtext_filter},hue=h=25"
+        else:
+            video_filter = drawtext_filter
+        
+        codec_configs = select_codec_configs(preset, smooth_mode)
+        
         if enable_pitch or enable_special_pitch:
             target_sped_duration = original_video_duration / 2.0
             target_final_duration = original_video_duration
@@ -1028,104 +1605,39 @@ def process_video_cumulative(input_path, output_path, export_num, iteration, ref
                 print(f"  Calculated tempo: {initial_tempo:.6f}")
                 print(f"  Calculated video_pts: {initial_video_pts:.6f}")
                 print(f"  Volume: {current_volume:.1f}dB -> {target_volume_db:.1f}dB (adjust: {volume_adjustment:+.1f}dB)")
+                if not smooth_mode:
+                    print(f"  Target: {target_size_mb:.2f} MB, {target_video_bitrate} kbps")
+                else:
+                    print(f"  Target: Lossless (smooth mode)")
             
             tempo = initial_tempo
             video_pts = initial_video_pts
             
-            frame_duration = 1.0 / original_fps
-            
-            best_tempo = tempo
-            best_video_pts = video_pts
-            best_error = float('inf')
-            best_duration = 0
+            # SPEEDEXP_PREFER_ATEMPO=1: small pitch shifts use asetrate+atempo, far lighter than rubberband.
+            # Decided here so the log below names the filter that actually runs
+            use_rubberband = has_rubberband and not (
+                abs(pitch_ratio - 1.0) < 0.1 and os.environ.get('SPEEDEXP_PREFER_ATEMPO') == '1'
+            )
             
             if not silent:
-                print(f"  Step 1/3: Speedup with duration correction...")
-            
-            for attempt in range(MAX_SPEED_RETRIES):
-                if attempt == 0:
-                    if not silent:
-                        if has_rubberband and has_audio:
-                            print(f"    Attempt {attempt+1}: tempo={tempo:.6f}, pitch={pitch_ratio:.6f}")
-                        elif has_audio:
-                            print(f"    Attempt {attempt+1}: tempo={tempo:.6f} (atempo fallback)")
-                        else:
-                            print(f"    Attempt {attempt+1}: video_pts={video_pts:.6f} (no audio)")
+                print(f"  Speedup + duplicate + text, trimmed to {target_final_duration:.6f}s...")
+                if use_rubberband and has_audio:
+                    print(f"    tempo={tempo:.6f}, pitch={pitch_ratio:.6f}")
+                elif has_audio:
+                    print(f"    tempo={tempo:.6f} (atempo fallback)")
                 else:
-                    if not silent:
-                        print(f"    Attempt {attempt+1}: tempo={tempo:.6f}, video_pts={video_pts:.6f}")
-                
-                if os.path.exists(temp_sped):
-                    try:
-                        os.remove(temp_sped)
-                    except:
-                        pass
-                
-                cmd_speed = build_speedup_command(
-                    input_path, temp_sped, tempo, video_pts, enable_pitch, enable_special_pitch,
-                    pitch_ratio, has_rubberband, has_audio, volume_adjustment, original_fps, preset, smooth_mode
-                )
-                
-                result = subprocess.run(cmd_speed, capture_output=True, text=True)
-                if result.returncode != 0:
-                    if not silent:
-                        print(f"      ✗ FFmpeg error: {result.stderr[-200:]}")
-                    raise RuntimeError(f"Speed-up failed: {result.stderr[-300:]}")
-                
-                valid, msg = verify_output_file(temp_sped)
-                if not valid:
-                    raise RuntimeError(f"Speed-up invalid: {msg}")
-                
-                actual_sped_duration = get_precise_duration(temp_sped)
-                duration_error = abs(actual_sped_duration - target_sped_duration)
-                
-                if not silent:
-                    print(f"      Result: {actual_sped_duration:.6f}s (target: {target_sped_duration:.6f}s, error: {duration_error:.6f}s)")
-                
-                if duration_error < best_error:
-                    best_error = duration_error
-                    best_tempo = tempo
-                    best_video_pts = video_pts
-                    best_duration = actual_sped_duration
-                
-                precision_threshold = min(0.001, frame_duration / 2)
-                
-                if duration_error <= precision_threshold:
-                    if not silent:
-                        print(f"      ✓ Perfect match achieved! Error: {duration_error:.6f}s")
-                    break
-                
-                if attempt > 0 and duration_error >= best_error and attempt >= 3:
-                    if not silent:
-                        print(f"      ⚠ Not improving, using best result (error: {best_error:.6f}s)")
-                    if best_duration != actual_sped_duration:
-                        tempo = best_tempo
-                        video_pts = best_video_pts
-                        if os.path.exists(temp_sped):
-                            os.remove(temp_sped)
-                        cmd_speed = build_speedup_command(
-                            input_path, temp_sped, tempo, video_pts, enable_pitch, enable_special_pitch,
-                            pitch_ratio, has_rubberband, has_audio, volume_adjustment, original_fps, preset, smooth_mode
-                        )
-                        subprocess.run(cmd_speed, capture_output=True, text=True)
-                    break
-                
-                correction_factor = actual_sped_duration / target_sped_duration
-                
-                if not silent:
-                    print(f"      Correction factor: {correction_factor:.6f}")
-                
-                tempo = tempo * correction_factor
-                video_pts = 1.0 / tempo
-                
-                tempo = max(0.5, min(tempo, 100.0))
-                video_pts = max(0.01, min(video_pts, 2.0))
+                    print(f"    video_pts={video_pts:.6f} (no audio)")
             
-            final_sped_duration = get_precise_duration(temp_sped)
-            final_error = abs(final_sped_duration - target_sped_duration)
-            
-            if not silent:
-                print(f"    Final: {final_sped_duration:.6f}s (error: {final_error:.6f}s, tempo: {tempo:.6f})")
+            codec_config, result = encode_with_fallback(
+                codec_configs, output_path,
+                lambda config: build_speedup_command(
+                    input_path, output_path, tempo, video_pts, enable_pitch, enable_special_pitch,
+                    pitch_ratio, use_rubberband, has_audio, volume_adjustment, original_fps, preset,
+                    smooth_mode, video_filter, config, target_video_bitrate, target_final_duration,
+                    input_info.get('sample_rate', 44100)
+                ),
+                silent
+            )
         
         else:
             tempo = 2.0
@@ -1136,200 +1648,38 @@ def process_video_cumulative(input_path, output_path, export_num, iteration, ref
                 if smooth_mode:
                     print(f"  Smooth Mode: ENABLED (libx264 lossless + pcm_s16le)")
                 print(f"  Input duration: {input_duration:.6f}s")
-                print(f"  Expected after speedup: {input_duration / 2.0:.6f}s")
+                print(f"  Expected after speedup + duplicate: {input_duration:.6f}s")
                 print(f"  Tempo: {tempo} (fixed)")
                 print(f"  Video PTS: {video_pts} (fixed)")
                 print(f"  Volume: {current_volume:.1f}dB -> {target_volume_db:.1f}dB (adjust: {volume_adjustment:+.1f}dB)")
-                print(f"  Step 1/3: Standard 2x speedup...")
-            
-            if os.path.exists(temp_sped):
-                try:
-                    os.remove(temp_sped)
-                except:
-                    pass
+                if not smooth_mode:
+                    print(f"  Target: {target_size_mb:.2f} MB, {target_video_bitrate} kbps")
+                else:
+                    print(f"  Target: Lossless (smooth mode)")
+                print(f"  Standard 2x speedup + duplicate + text...")
             
-            cmd_speed = build_speedup_command(
-                input_path, temp_sped, tempo, video_pts, enable_pitch, enable_special_pitch,
-                pitch_ratio, has_rubberband, has_audio, volume_adjustment, original_fps, preset, smooth_mode
+            codec_config, result = encode_with_fallback(
+                codec_configs, output_path,
+                lambda config: build_speedup_command(
+                    input_path, output_path, tempo, video_pts, enable_pitch, enable_special_pitch,
+                    pitch_ratio, has_rubberband, has_audio, volume_adjustment, original_fps, preset,
+                    smooth_mode, video_filter, config, target_video_bitrate
+                ),
+                silent
             )
-            
-            result = subprocess.run(cmd_speed, capture_output=True, text=True)
-            if result.returncode != 0:
-                raise RuntimeError(f"Speed-up failed: {result.stderr[-300:]}")
-            
-            valid, msg = verify_output_file(temp_sped)
-            if not valid:
-                raise RuntimeError(f"Speed-up invalid: {msg}")
-            
-            actual_sped_duration = get_precise_duration(temp_sped)
-            speed_ratio = input_duration / actual_sped_duration if actual_sped_duration > 0 else 0
-            
-            if not silent:
-                print(f"    Result: {actual_sped_duration:.6f}s (speed ratio: {speed_ratio:.2f}x)")
         
+        output_info = probe_all(output_path)
+        output_size_mb = output_info['size'] / (1024 * 1024)
         if not silent:
-            print(f"  Step 2/3: Duplicating video...")
-        
-        abs_temp_sped = os.path.abspath(temp_sped)
-        with open(temp_list, 'w') as f:
-            f.write(f"file '{abs_temp_sped}'\n")
-            f.write(f"file '{abs_temp_sped}'\n")
-        
-        cmd_concat = [
-            'ffmpeg',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', temp_list,
-            '-c', 'copy',
-            '-y', temp_concat
-        ]
-        
-        result = subprocess.run(cmd_concat, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(f"Concat failed: {result.stderr[-300:]}")
-        
-        valid, msg = verify_output_file(temp_concat)
-        if not valid:
-            raise RuntimeError(f"Concat invalid: {msg}")
+            print(f"    ✓ {codec_config['name']}: {output_size_mb:.2f} MB")
         
-        concat_duration = get_precise_duration(temp_concat)
+        # Next export reads this file, so keep the volume measured while writing it
+        output_volume = parse_mean_volume(result.stderr)
+        if output_volume is not None:
+            _VOLUME_CACHE[_file_key(output_path)] = output_volume
         
-        if not silent:
-            if enable_pitch or enable_special_pitch:
-                concat_error = abs(concat_duration - original_video_duration)
-                print(f"    Concatenated: {concat_duration:.6f}s (target: {original_video_duration:.6f}s, error: {concat_error:.6f}s)")
-            else:
-                print(f"    Concatenated: {concat_duration:.6f}s")
-        
-        if not silent:
-            print(f"  Step 3/3: Adding text and exporting...")
-        
-        target_size_mb = reference_size_mb * 1.15
-        target_bitrate_total = (target_size_mb * 8 * 1024) / concat_duration
-        audio_bitrate = 128
-        target_video_bitrate = max(500, int(target_bitrate_total - audio_bitrate))
-        
-        if not silent:
-            if not smooth_mode:
-                print(f"    Target: {target_size_mb:.2f} MB, {target_video_bitrate} kbps")
-            else:
-                print(f"    Target: Lossless (smooth mode)")
-        
-        drawtext_filter = (
-            f"drawtext=text='{text_escaped}':"
-            f"fontcolor=red:"
-            f"bordercolor=blue:borderw=3:"
-            f"fontsize={text_size}:"
-            f"box=1:boxcolor=black@0.12:boxborderw=8:"
-            f"x=20:y=h-th-20"
-        )
-        
-        if enable_color_mode:
-            video_filter = f"{drawtext_filter},hue=h=25"
-        else:
-            video_filter = drawtext_filter
-        
-        codec_configs = select_codec_configs(preset, smooth_mode)
-        success = False
-        last_error = None
-        
-        for codec_config in codec_configs:
-            if success:
-                break
-            
-            codec_name = codec_config['name']
-            codec = codec_config['codec']
-            codec_params = codec_config['params']
-            
-            if not silent:
-                print(f"    Trying {codec_name}...")
-            
-            if os.path.exists(output_path):
-                try:
-                    os.remove(output_path)
-                except:
-                    pass
-            
-            concat_info = get_video_info(temp_concat)
-            
-            if smooth_mode:
-                if concat_info.get('has_audio', True):
-                    cmd_text = [
-                        'ffmpeg', '-i', temp_concat,
-                        '-vf', video_filter,
-                        '-c:v', codec
-                    ] + codec_params + [
-                        '-r', str(original_fps),
-                        '-c:a', 'pcm_s16le',
-                        '-y', output_path
-                    ]
-                else:
-                    cmd_text = [
-                        'ffmpeg', '-i', temp_concat,
-                        '-vf', video_filter,
-                        '-c:v', codec
-                    ] + codec_params + [
-                        '-r', str(original_fps),
-                        '-an',
-                        '-y', output_path
-                    ]
-            else:
-                if concat_info.get('has_audio', True):
-                    cmd_text = [
-                        'ffmpeg', '-i', temp_concat,
-                        '-vf', video_filter,
-                        '-c:v', codec
-                    ] + codec_params + [
-                        '-b:v', f'{target_video_bitrate}k',
-                        '-maxrate', f'{int(target_video_bitrate * 1.5)}k',
-                        '-bufsize', f'{int(target_video_bitrate * 2)}k',
-                        '-r', str(original_fps),
-                        '-c:a', 'aac',
-                        '-b:a', '128k',
-                        '-movflags', '+faststart',
-                        '-max_muxing_queue_size', '1024',
-                        '-y', output_path
-                    ]
-                else:
-                    cmd_text = [
-                        'ffmpeg', '-i', temp_concat,
-                        '-vf', video_filter,
-                        '-c:v', codec
-                    ] + codec_params + [
-                        '-b:v', f'{target_video_bitrate}k',
-                        '-maxrate', f'{int(target_video_bitrate * 1.5)}k',
-                        '-bufsize', f'{int(target_video_bitrate * 2)}k',
-                        '-r', str(original_fps),
-                        '-an',
-                        '-movflags', '+faststart',
-                        '-y', output_path
-                    ]
-            
-            result = subprocess.run(cmd_text, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                valid, msg = verify_output_file(output_path)
-                if valid:
-                    output_info = get_video_info(output_path)
-                    output_size_mb = output_info['size'] / (1024 * 1024)
-                    if not silent:
-                        print(f"    ✓ {codec_name}: {output_size_mb:.2f} MB")
-                    success = True
-                else:
-                    if not silent:
-                        print(f"    ✗ {codec_name}: {msg}")
-                    last_error = msg
-            else:
-                error_msg = result.stderr[-200:] if result.stderr else "Unknown"
-                if not silent:
-                    print(f"    ✗ {codec_name}: {error_msg}")
-                last_error = error_msg
-        
-        if not success:
-            raise RuntimeError(f"All codecs failed: {last_error}")
-        
-        final_duration = get_precise_duration(output_path)
-        cumulative_speed = 2 ** (iteration + 1)
+        final_duration = output_info['duration']
+        cumulative_speed = 1 << (iteration + 1)
         
         if not silent:
             print(f"✓ Export {export_num} completed")
@@ -1346,14 +1696,6 @@ def process_video_cumulative(input_path, output_path, export_num, iteration, ref
         
     except Exception as e:
         raise RuntimeError(f"Error: {str(e)}")
-        
-    finally:
-        for temp_file in temp_files:
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except:
-                    pass
 
 def compile_exports(export_files, exports_dir, original_fps, preset='fast', watermark_size=DEFAULT_WATERMARK_SIZE, smooth_mode=False):
     """Compile all exports into single video with watermark"""
@@ -1371,28 +1713,30 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
         if smooth_mode:
             print(f"  Smooth Mode: ENABLED (libx264 lossless + pcm_s16le)")
         
-        temp_list = os.path.join(exports_dir, f"temp_compile_list_{os.getpid()}.txt")
+        total_bytes = sum(os.path.getsize(f) for f in export_files if os.path.exists(f))
+        temp_dir = get_temp_dir(exports_dir, total_bytes)
         
-        with open(temp_list, 'w') as f:
-            for export_file in export_files:
-                abs_path = os.path.abspath(export_file)
-                f.write(f"file '{abs_path}'\n")
+        # The concat list is fed to ffmpeg on stdin instead of a temp file
+        concat_list = "".join(f"file '{os.path.abspath(export_file)}'\n" for export_file in export_files)
         
         temp_ext = get_file_extension(smooth_mode)
-        temp_concat = os.path.join(exports_dir, f"temp_compile_concat_{os.getpid()}{temp_ext}")
+        temp_concat = os.path.join(temp_dir, f"temp_compile_concat_{os.getpid()}{temp_ext}")
         
         print(f"  Step 1/2: Concatenating exports...")
         
         cmd_concat = [
-            'ffmpeg',
+            'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostats',
+            '-fflags', '+genpts',
             '-f', 'concat',
             '-safe', '0',
-            '-i', temp_list,
+            '-protocol_whitelist', 'pipe,file',
+            '-i', 'pipe:0',
             '-c', 'copy',
+            '-avoid_negative_ts', 'make_zero',
             '-y', temp_concat
         ]
         
-        result = subprocess.run(cmd_concat, capture_output=True, text=True)
+        result = subprocess.run(cmd_concat, input=concat_list, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         if result.returncode != 0:
             raise RuntimeError(f"Compilation concat failed: {result.stderr[-300:]}")
         
@@ -1408,7 +1752,7 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
         watermark_text = escape_text_for_ffmpeg("Made with SpeedExp.py.")
         
         watermark_filter = (
-            f"drawtext=text='{watermark_text}':"
+            f"drawtext={DRAWTEXT_FONT}text='{watermark_text}':"
             f"fontcolor=white@0.75:"
             f"bordercolor=black@0.75:borderw=2:"
             f"fontsize={watermark_size}:"
@@ -1437,7 +1781,7 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
             
             if smooth_mode:
                 cmd_watermark = [
-                    'ffmpeg', '-i', temp_concat,
+                    'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostats', '-i', temp_concat,
                     '-vf', watermark_filter,
                     '-c:v', codec
                 ] + codec_params + [
@@ -1447,7 +1791,7 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
                 ]
             else:
                 cmd_watermark = [
-                    'ffmpeg', '-i', temp_concat,
+                    'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostats', '-i', temp_concat,
                     '-vf', watermark_filter,
                     '-c:v', codec
                 ] + codec_params + [
@@ -1459,7 +1803,7 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
                     '-y', output_path
                 ]
             
-            result = subprocess.run(cmd_watermark, capture_output=True, text=True)
+            result = subprocess.run(cmd_watermark, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
             
             if result.returncode == 0:
                 valid, msg = verify_output_file(output_path)
@@ -1472,7 +1816,7 @@ def compile_exports(export_files, exports_dir, original_fps, preset='fast', wate
                 error_msg = result.stderr[-200:] if result.stderr else "Unknown"
                 print(f"    ✗ {codec_name}: {error_msg}")
         
-        for temp_file in [temp_list, temp_concat]:
+        for temp_file in [temp_concat]:
             if os.path.exists(temp_file):
                 try:
                     os.remove(temp_file)
@@ -1527,8 +1871,7 @@ def compile_existing_exports_mode(exports_dir, preset='fast', smooth_mode=False)
         total_size += size_mb
         total_duration += duration
         
-        pow_val = 2 ** export_num
-        pow_display = format_power_notation(pow_val)
+        pow_display = format_power_notation((2, export_num))
         
         print(f"  [{export_num}] {filename}")
         print(f"      Size: {size_mb:.2f} MB | Duration: {duration:.2f}s")
@@ -1545,7 +1888,7 @@ def compile_existing_exports_mode(exports_dir, preset='fast', smooth_mode=False)
     if smooth_mode:
         print(f"  Smooth Mode: ENABLED (libx264 lossless + pcm_s16le)")
     
-    watermark_size_input = input("\nResize watermark to?: ").strip()
+    watermark_size_input = ask("\nResize watermark to?: ")
     if watermark_size_input and watermark_size_input.isdigit():
         watermark_size = int(watermark_size_input)
         if watermark_size <= 0:
@@ -1554,7 +1897,7 @@ def compile_existing_exports_mode(exports_dir, preset='fast', smooth_mode=False)
     else:
         watermark_size = DEFAULT_WATERMARK_SIZE
     
-    confirm = input("\nProceed with compilation? (N/Y): ").strip().upper()
+    confirm = ask("\nProceed with compilation? (N/Y): ").upper()
     
     if confirm != 'Y':
         print("Compilation cancelled.")
@@ -1569,12 +1912,18 @@ def compile_existing_exports_mode(exports_dir, preset='fast', smooth_mode=False)
 def main():
     """Main function"""
     try:
+        args = parse_args()
+        
         print("=== SpeedExp.py - a program for helping speedy collabs ===")
         print("Checking dependencies...")
         has_rubberband, has_loudnorm = check_dependencies()
         
         ffmpeg_version = get_ffmpeg_version()
         print(f"  FFmpeg: {ffmpeg_version}")
+        
+        # Probed once here; every later codec selection reuses the cached result
+        available_codecs = get_available_codecs()
+        print(f"  Available codecs: {[k for k, v in available_codecs.items() if v]}")
         print()
         
         termux_path = "/data/data/com.termux/files/home/storage/downloads"
@@ -1587,7 +1936,7 @@ def main():
         exports_dir = create_exports_folder()
         
         # Smooth mode input (at the very start)
-        smooth_mode_input = input("\nEnable smooth mode? (N/Y): ").strip().upper()
+        smooth_mode_input = answer_or_ask(args.smooth, "\nEnable smooth mode? (N/Y): ")
         if smooth_mode_input == 'Y':
             smooth_mode = True
             print("  ✓ Smooth mode enabled (libx264 lossless + pcm_s16le, .mov output)")
@@ -1597,18 +1946,25 @@ def main():
             print("  Invalid input, defaulting to N")
             smooth_mode = False
         
-        compile_existing_input = input("\nCompile Existing export files? (N/Y): ").strip().upper()
+        # A video on the command line means a normal export run
+        if args.video is not None:
+            compile_existing_input = 'N'
+        else:
+            compile_existing_input = ask("\nCompile Existing export files? (N/Y): ").upper()
         
         if compile_existing_input == 'Y':
-            fast_export_input = input("Use fast exports? (N/Y/Z/U)?: ").strip().upper()
-            if fast_export_input == 'Y':
-                preset = 'veryfast'
-            elif fast_export_input == 'Z':
-                preset = 'superfast'
-            elif fast_export_input == 'U':
-                preset = 'ultrafast'
+            if args.preset is not None:
+                preset = args.preset
             else:
-                preset = 'fast'
+                fast_export_input = ask("Use fast exports? (N/Y/Z/U)?: ").upper()
+                if fast_export_input == 'Y':
+                    preset = 'veryfast'
+                elif fast_export_input == 'Z':
+                    preset = 'superfast'
+                elif fast_export_input == 'U':
+                    preset = 'ultrafast'
+                else:
+                    preset = 'fast'
             
             result = compile_existing_exports_mode(exports_dir, preset, smooth_mode)
             if result:
@@ -1622,10 +1978,10 @@ def main():
             print("  Invalid input, continuing with normal export process...\n")
         
         use_moviepy = False
-        moviepy_input = input("\nUse moviepy? (N/Y): ").strip().upper()
+        moviepy_input = answer_or_ask(args.moviepy, "\nUse moviepy? (N/Y): ")
         
         if moviepy_input == 'Y':
-            if not MOVIEPY_AVAILABLE:
+            if not ensure_moviepy():
                 print("  ❌ MoviePy is not installed or not found!")
                 if MOVIEPY_ERROR:
                     print(f"  Error: {MOVIEPY_ERROR}")
@@ -1638,7 +1994,10 @@ def main():
             print("  Invalid input, using FFmpeg...\n")
         
         use_editor_selection = False
-        editor_input = input("\nSelect from video editor folders? (N/Y): ").strip().upper()
+        if args.video is not None:
+            editor_input = 'N'
+        else:
+            editor_input = ask("\nSelect from video editor folders? (N/Y): ").upper()
         
         if editor_input == 'Y':
             movies_path, directories = get_movies_directories()
@@ -1655,14 +2014,19 @@ def main():
         elif editor_input != 'N':
             print("  Invalid input, using manual input...\n")
         
-        video_path, num_exports, start_num, enable_pitch, enable_special_pitch, text_size, enable_color_mode, preset, watermark_size = get_user_inputs(use_editor_selection)
+        video_path, num_exports, start_num, enable_pitch, enable_special_pitch, text_size, enable_color_mode, preset, watermark_size = get_user_inputs(use_editor_selection, args)
         
         initial_info = get_video_info(video_path)
         initial_size = initial_info['size'] / (1024 * 1024)
         original_video_duration = get_precise_duration(video_path)
         original_fps = initial_info.get('fps', 30.0)
         
-        target_volume_db = get_audio_volume(video_path) if initial_info.get('has_audio') else -20.0
+        target_volume_db = None
+        if video_path in _VOLUME_PREFETCH:
+            target_volume_db = _VOLUME_PREFETCH.pop(video_path).result()
+        if target_volume_db is None:
+            # Not prefetched, or the quiet background pass failed: measure here so any warning shows
+            target_volume_db = get_audio_volume(video_path) if initial_info.get('has_audio') else -20.0
         
         ext = get_file_extension(smooth_mode)
         
@@ -1711,7 +2075,11 @@ def main():
         print(f"  Watermark Size: {watermark_size} (75% opacity)")
         print(f"  Processing: CUMULATIVE")
         
+        compile_input = answer_or_ask(args.compile, "\nCompile all exports into Video? (N/Y): ")
+        
         exported_files = []
+        # (path, size MB, duration) recorded as each export is written, for the summary
+        export_records = []
         
         print(f"\nStarting export process...")
         print(f"Flow: Original → Export 1 → Export 2 → ... → Export {num_exports}")
@@ -1723,66 +2091,34 @@ def main():
             print(f"Non-pitch mode: Standard 2x speed per iteration")
         print()
         
+        # Every export is named up front against one listing of the folder
+        taken_names = set(os.listdir(exports_dir))
+        planned_outputs = [
+            get_unique_filename(exports_dir, f"export-{start_num + i}", smooth_mode, taken_names)
+            for i in range(num_exports)
+        ]
+        
+        # 2^N for every export, shared by the export loop and the summary
+        powers = [(2, start_num + i) for i in range(num_exports)]
+        
         current_input = video_path
+        current_info = dict(initial_info, mean_volume=target_volume_db)
         reference_size = initial_size
         
         if use_moviepy:
             print(f"{'='*60}")
             print("PROCESSING WITH MOVIEPY")
             print(f"{'='*60}")
-            init_progress_bar()
-            
-            for i in range(num_exports):
-                export_num = start_num + i
-                
-                base_name = f"export-{export_num}"
-                output_path, actual_name = get_unique_filename(exports_dir, base_name, smooth_mode)
-                
-                try:
-                    success = process_video_cumulative(
-                        current_input,
-                        output_path,
-                        export_num,
-                        i,
-                        reference_size,
-                        enable_pitch,
-                        enable_special_pitch,
-                        has_rubberband,
-                        has_loudnorm,
-                        target_volume_db,
-                        original_fps,
-                        original_video_duration,
-                        use_moviepy=True,
-                        silent=True,
-                        text_size=text_size,
-                        enable_color_mode=enable_color_mode,
-                        preset=preset,
-                        smooth_mode=smooth_mode
-                    )
-                    
-                    if not success:
-                        raise RuntimeError(f"Failed export {export_num}")
-                    
-                    exported_files.append(output_path)
-                    current_input = output_path
-                    
-                    print_progress_bar(i + 1, num_exports)
-                    
-                except Exception as e:
-                    finish_progress_bar()
-                    raise RuntimeError(f"Export {export_num} failed: {e}")
-            
-            finish_progress_bar()
+            print_progress_bar(0, num_exports)
+        
+        # One loop for both modes: MoviePy runs quietly behind the progress bar,
+        # FFmpeg prints a header and the result for every export
+        for i in range(num_exports):
+            export_num = start_num + i
+            output_path, actual_name = planned_outputs[i]
             
-        else:
-            for i in range(num_exports):
-                export_num = start_num + i
-                
-                current_pow = 2 ** export_num
-                power_display = format_power_notation(current_pow)
-                
-                base_name = f"export-{export_num}"
-                output_path, actual_name = get_unique_filename(exports_dir, base_name, smooth_mode)
+            if not use_moviepy:
+                power_display = format_power_notation(powers[i])
                 
                 if enable_special_pitch:
                     _, pitch_semitones = get_special_pitch_for_iteration(i)
@@ -1793,22 +2129,27 @@ def main():
                 else:
                     pitch_info = "None"
                 
-                print(f"\n{'='*60}")
-                print(f"[Export {i+1}/{num_exports}]")
-                print(f"  Export Number: {export_num}")
-                print(f"  Input: {os.path.basename(current_input)}")
-                print(f"  Output: {actual_name}{ext}")
-                print(f"  Text: '{export_num} - {power_display}'")
-                print(f"  Pitch: {pitch_info}")
+                # Header is collected and written in one go rather than a write per line
+                lines = [
+                    f"\n{'='*60}",
+                    f"[Export {i+1}/{num_exports}]",
+                    f"  Export Number: {export_num}",
+                    f"  Input: {os.path.basename(current_input)}",
+                    f"  Output: {actual_name}{ext}",
+                    f"  Text: '{export_num} - {power_display}'",
+                    f"  Pitch: {pitch_info}",
+                ]
                 if enable_pitch or enable_special_pitch:
-                    print(f"  Target Duration: {original_video_duration:.6f}s (original)")
-                print(f"  Expected Speed: {2**(i+1)}x from original")
+                    lines.append(f"  Target Duration: {original_video_duration:.6f}s (original)")
+                lines.append(f"  Expected Speed: {1 << (i + 1)}x from original")
                 if enable_color_mode:
-                    print(f"  Color: Hue +25")
+                    lines.append(f"  Color: Hue +25")
                 if smooth_mode:
-                    print(f"  Codec: libx264 lossless + pcm_s16le")
-                print(f"{'='*60}")
-                
+                    lines.append(f"  Codec: libx264 lossless + pcm_s16le")
+                lines.append(f"{'='*60}")
+                print("\n".join(lines), flush=True)
+            
+            try:
                 success = process_video_cumulative(
                     current_input,
                     output_path,
@@ -1822,12 +2163,14 @@ def main():
                     target_volume_db,
                     original_fps,
                     original_video_duration,
-                    use_moviepy=False,
-                    silent=False,
+                    use_moviepy=use_moviepy,
+                    silent=use_moviepy,
                     text_size=text_size,
                     enable_color_mode=enable_color_mode,
                     preset=preset,
-                    smooth_mode=smooth_mode
+                    smooth_mode=smooth_mode,
+                    progress_callback=(lambda fraction: print_progress_bar(i + fraction, num_exports)) if use_moviepy else None,
+                    input_info=current_info
                 )
                 
                 if not success:
@@ -1835,20 +2178,34 @@ def main():
                 
                 exported_files.append(output_path)
                 
-                output_size = check_file_size(output_path)
-                speedup = 2 ** (i + 1)
-                size_percent = (output_size / initial_size) * 100
-                
-                export_duration = get_precise_duration(output_path)
-                
-                print(f"  Size: {output_size:.2f} MB ({size_percent:.1f}%)")
-                if enable_pitch or enable_special_pitch:
-                    duration_error = abs(export_duration - original_video_duration)
-                    print(f"  Duration Match: {export_duration:.6f}s (error: {duration_error:.6f}s)")
-                else:
-                    print(f"  Duration: {export_duration:.2f}s")
-                
+                # The export's probe feeds the next step and also gives its size and duration.
+                # In FFmpeg mode these are cache hits: probed and volume-measured while written
                 current_input = output_path
+                current_info = probe_all(output_path, with_volume=not use_moviepy)
+                output_size = current_info['size'] / (1024 * 1024)
+                export_duration = current_info['duration']
+                export_records.append((output_path, output_size, export_duration))
+                
+            except Exception as e:
+                if not use_moviepy:
+                    raise
+                finish_progress_bar()
+                raise RuntimeError(f"Export {export_num} failed: {e}")
+            
+            if use_moviepy:
+                print_progress_bar(i + 1, num_exports)
+                continue
+            
+            size_percent = (output_size / initial_size) * 100
+            print(f"  Size: {output_size:.2f} MB ({size_percent:.1f}%)")
+            if enable_pitch or enable_special_pitch:
+                duration_error = abs(export_duration - original_video_duration)
+                print(f"  Duration Match: {export_duration:.6f}s (error: {duration_error:.6f}s)")
+            else:
+                print(f"  Duration: {export_duration:.2f}s")
+        
+        if use_moviepy:
+            finish_progress_bar()
         
         print(f"\n{'='*60}")
         print(f"✓ ALL {num_exports} EXPORTS COMPLETED!")
@@ -1859,13 +2216,11 @@ def main():
         print(f"\nExport Summary:")
         print(f"{'='*60}")
         
-        for i, export_file in enumerate(exported_files):
+        summary_lines = []
+        for i, (export_file, size, export_duration) in enumerate(export_records):
             export_num = start_num + i
-            size = check_file_size(export_file)
-            export_duration = get_precise_duration(export_file)
-            pow_val = 2 ** export_num
-            pow_display = format_power_notation(pow_val)
-            speedup = 2 ** (i + 1)
+            pow_display = format_power_notation(powers[i])
+            speedup = 1 << (i + 1)
             size_ratio = (size / initial_size) * 100
             
             if enable_special_pitch:
@@ -1879,23 +2234,22 @@ def main():
             else:
                 pitch_display = "None"
             
-            print(f"\n  {os.path.basename(export_file)}:")
-            print(f"    Size: {size:.2f} MB ({size_ratio:.1f}%)")
+            summary_lines.append(f"\n  {os.path.basename(export_file)}:")
+            summary_lines.append(f"    Size: {size:.2f} MB ({size_ratio:.1f}%)")
             if enable_pitch or enable_special_pitch:
-                print(f"    Duration: {export_duration:.6f}s (error: {duration_error:.6f}s)")
+                summary_lines.append(f"    Duration: {export_duration:.6f}s (error: {duration_error:.6f}s)")
             else:
-                print(f"    Duration: {export_duration:.2f}s")
-            print(f"    Text: '{export_num} - {pow_display}'")
-            print(f"    Speed: {speedup}x | Pitch: {pitch_display}")
+                summary_lines.append(f"    Duration: {export_duration:.2f}s")
+            summary_lines.append(f"    Text: '{export_num} - {pow_display}'")
+            summary_lines.append(f"    Speed: {speedup}x | Pitch: {pitch_display}")
             if enable_color_mode:
-                print(f"    Color: Hue +25")
+                summary_lines.append(f"    Color: Hue +25")
             if smooth_mode:
-                print(f"    Codec: libx264 lossless + pcm_s16le")
+                summary_lines.append(f"    Codec: libx264 lossless + pcm_s16le")
         
+        print("\n".join(summary_lines), flush=True)
         print(f"\n{'='*60}")
         
-        compile_input = input("\nCompile all exports into Video? (N/Y): ").strip().upper()
-        
         if compile_input == 'Y':
             compile_exports(exported_files, exports_dir, original_fps, preset, watermark_size, smooth_mode)
         else:
@@ -1925,6 +2279,8 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        cancel_volume_prefetch()
 
 if __name__ == "__main__":
     main()